@@ -17,30 +17,83 @@ Output:
 import re
 import sys
 from pathlib import Path
+from typing import NamedTuple
 
 
-def parse_config_h(config_path):
-    """Parse Config.h to extract lamp configuration."""
-    with open(config_path, 'r') as f:
-        content = f.read()
+# 1 knot = 0.514444 m/s
+KNOTS_TO_MPS = 0.514444
 
-    # Extract configuration values using regex
-    config = {}
+# Marker positions to calculate for the physical legend
+WAVE_MARKER_HEIGHTS_M = (1.0, 2.0, 3.0)
+WIND_MARKER_KNOTS = (10, 20, 30)
 
+# Config.h values read by parse_config_h, and the type each is parsed as
+CONFIG_KEYS = {
     # LED strip mapping
-    config['WAVE_HEIGHT_BOTTOM'] = int(re.search(r'#define WAVE_HEIGHT_BOTTOM\s+(\d+)', content).group(1))
-    config['WAVE_HEIGHT_TOP'] = int(re.search(r'#define WAVE_HEIGHT_TOP\s+(\d+)', content).group(1))
-    config['WIND_SPEED_BOTTOM'] = int(re.search(r'#define WIND_SPEED_BOTTOM\s+(\d+)', content).group(1))
-    config['WIND_SPEED_TOP'] = int(re.search(r'#define WIND_SPEED_TOP\s+(\d+)', content).group(1))
-    config['WAVE_PERIOD_BOTTOM'] = int(re.search(r'#define WAVE_PERIOD_BOTTOM\s+(\d+)', content).group(1))
-    config['WAVE_PERIOD_TOP'] = int(re.search(r'#define WAVE_PERIOD_TOP\s+(\d+)', content).group(1))
+    'WAVE_HEIGHT_BOTTOM': int,
+    'WAVE_HEIGHT_TOP': int,
+    'WIND_SPEED_BOTTOM': int,
+    'WIND_SPEED_TOP': int,
+    'WAVE_PERIOD_BOTTOM': int,
+    'WAVE_PERIOD_TOP': int,
 
     # Scaling parameters
-    config['MAX_WAVE_HEIGHT_METERS'] = float(re.search(r'#define MAX_WAVE_HEIGHT_METERS\s+([\d.]+)', content).group(1))
-    config['MAX_WIND_SPEED_MPS'] = float(re.search(r'#define MAX_WIND_SPEED_MPS\s+([\d.]+)', content).group(1))
+    'MAX_WAVE_HEIGHT_METERS': float,
+    'MAX_WIND_SPEED_MPS': float,
 
     # Arduino ID
-    config['ARDUINO_ID'] = int(re.search(r'const int ARDUINO_ID\s*=\s*(\d+)', content).group(1))
+    'ARDUINO_ID': int,
+}
+
+
+class LampConfig(NamedTuple):
+    """Lamp settings parsed from Config.h, plus derived strip lengths and directions."""
+    WAVE_HEIGHT_BOTTOM: int
+    WAVE_HEIGHT_TOP: int
+    WIND_SPEED_BOTTOM: int
+    WIND_SPEED_TOP: int
+    WAVE_PERIOD_BOTTOM: int
+    WAVE_PERIOD_TOP: int
+    MAX_WAVE_HEIGHT_METERS: float
+    MAX_WIND_SPEED_MPS: float
+    ARDUINO_ID: int
+    WAVE_HEIGHT_LENGTH: int
+    WIND_SPEED_LENGTH: int
+    WAVE_PERIOD_LENGTH: int
+    WAVE_HEIGHT_FORWARD: bool
+    WIND_SPEED_FORWARD: bool
+
+
+# One pattern for both "#define NAME value" and "const int NAME = value;"
+CONFIG_VALUE_PATTERN = re.compile(r'#define\s+(\w+)\s+(\d+(?:\.\d+)?)|const\s+int\s+(\w+)\s*=\s*(\d+)')
+
+
+def parse_config_h(config_path):
+    """Parse Config.h to extract lamp configuration as a LampConfig."""
+    # Stream the file line by line; only "#define" and "const" lines hold values
+    config = {}
+    with open(config_path, 'r') as f:
+        for line in f:
+            line = line.lstrip()
+            if not line.startswith(('#define', 'const')):
+                continue
+
+            match = CONFIG_VALUE_PATTERN.match(line)
+            if not match:
+                continue
+
+            name = match.group(1) or match.group(3)
+            value = match.group(2) or match.group(4)
+            # Keep the first definition of each key
+            if name in CONFIG_KEYS and name not in config:
+                # Go through float so an int key written as "1.0" still reads as 1
+                config[name] = CONFIG_KEYS[name](float(value))
+                if len(config) == len(CONFIG_KEYS):
+                    break  # Everything found, skip the rest of the file
+
+    missing = [key for key in CONFIG_KEYS if key not in config]
+    if missing:
+        raise ValueError(f"Config.h is missing: {', '.join(missing)}")
 
     # Calculate strip lengths and directions
     config['WAVE_HEIGHT_LENGTH'] = abs(config['WAVE_HEIGHT_TOP'] - config['WAVE_HEIGHT_BOTTOM']) + 1
@@ -50,7 +103,7 @@ def parse_config_h(config_path):
     config['WAVE_HEIGHT_FORWARD'] = config['WAVE_HEIGHT_BOTTOM'] < config['WAVE_HEIGHT_TOP']
     config['WIND_SPEED_FORWARD'] = config['WIND_SPEED_BOTTOM'] < config['WIND_SPEED_TOP']
 
-    return config
+    return LampConfig(**config)
 
 
 def calculate_wave_height_leds(wave_height_m, config):
@@ -58,8 +111,8 @@ def calculate_wave_height_leds(wave_height_m, config):
     Calculate how many LEDs light up for given wave height.
     Matches Arduino formula: numLEDs = (wave_height_m / MAX_WAVE_HEIGHT_METERS) * WAVE_HEIGHT_LENGTH
     """
-    max_height = config['MAX_WAVE_HEIGHT_METERS']
-    strip_length = config['WAVE_HEIGHT_LENGTH']
+    max_height = config.MAX_WAVE_HEIGHT_METERS
+    strip_length = config.WAVE_HEIGHT_LENGTH
 
     # Arduino calculation
     num_leds = int((wave_height_m / max_height) * strip_length)
@@ -68,16 +121,13 @@ def calculate_wave_height_leds(wave_height_m, config):
     num_leds = max(0, min(num_leds, strip_length))
 
     # Calculate physical LED indices
-    bottom = config['WAVE_HEIGHT_BOTTOM']
-    forward = config['WAVE_HEIGHT_FORWARD']
+    bottom = config.WAVE_HEIGHT_BOTTOM
+    forward = config.WAVE_HEIGHT_FORWARD
 
-    lit_leds = []
-    for i in range(num_leds):
-        if forward:
-            led_index = bottom + i
-        else:
-            led_index = bottom - i
-        lit_leds.append(led_index)
+    if forward:
+        lit_leds = list(range(bottom, bottom + num_leds))
+    else:
+        lit_leds = list(range(bottom, bottom - num_leds, -1))
 
     return num_leds, lit_leds
 
@@ -90,11 +140,11 @@ def calculate_wind_speed_leds(wind_speed_knots, config):
     Note: Wind strip has status LED at bottom and direction LED at top,
     so usable LEDs = WIND_SPEED_LENGTH - 2
     """
-    # Convert knots to m/s (1 knot = 0.514444 m/s)
-    wind_speed_mps = wind_speed_knots * 0.514444
+    # Convert knots to m/s
+    wind_speed_mps = wind_speed_knots * KNOTS_TO_MPS
 
-    max_wind = config['MAX_WIND_SPEED_MPS']
-    strip_length = config['WIND_SPEED_LENGTH']
+    max_wind = config.MAX_WIND_SPEED_MPS
+    strip_length = config.WIND_SPEED_LENGTH
 
     # Usable LEDs (excluding status and direction LEDs)
     usable_length = strip_length - 2
@@ -108,117 +158,121 @@ def calculate_wind_speed_leds(wind_speed_knots, config):
     # Calculate physical LED indices
     # Wind strip: bottom LED = status, top LED = direction
     # Data LEDs start from bottom+1 (or bottom-1 if reversed)
-    bottom = config['WIND_SPEED_BOTTOM']
-    forward = config['WIND_SPEED_FORWARD']
+    bottom = config.WIND_SPEED_BOTTOM
+    forward = config.WIND_SPEED_FORWARD
 
-    lit_leds = []
-    for i in range(num_leds):
-        if forward:
-            led_index = bottom + 1 + i  # Skip status LED at bottom
-        else:
-            led_index = bottom - 1 - i  # Skip status LED at bottom
-        lit_leds.append(led_index)
+    if forward:
+        lit_leds = list(range(bottom + 1, bottom + 1 + num_leds))  # Skip status LED at bottom
+    else:
+        lit_leds = list(range(bottom - 1, bottom - 1 - num_leds, -1))  # Skip status LED at bottom
 
     return num_leds, lit_leds, wind_speed_mps
 
 
 def print_header(config):
     """Print lamp configuration header."""
-    print("=" * 70)
-    print(f"LED MARKER CALCULATOR - Lamp {config['ARDUINO_ID']}")
-    print("=" * 70)
-    print()
-    print("CONFIGURATION:")
-    print(f"  Wave Height Strip: LED {config['WAVE_HEIGHT_BOTTOM']} → {config['WAVE_HEIGHT_TOP']} ({config['WAVE_HEIGHT_LENGTH']} LEDs)")
-    print(f"  Wind Speed Strip:  LED {config['WIND_SPEED_BOTTOM']} → {config['WIND_SPEED_TOP']} ({config['WIND_SPEED_LENGTH']} LEDs)")
-    print(f"  Wave Period Strip: LED {config['WAVE_PERIOD_BOTTOM']} → {config['WAVE_PERIOD_TOP']} ({config['WAVE_PERIOD_LENGTH']} LEDs)")
-    print()
-    print(f"  Max Wave Height: {config['MAX_WAVE_HEIGHT_METERS']} meters")
-    print(f"  Max Wind Speed:  {config['MAX_WIND_SPEED_MPS']} m/s (~{config['MAX_WIND_SPEED_MPS'] / 0.514444:.1f} knots)")
-    print()
-    print("=" * 70)
-    print()
-
-
-def print_wave_height_markers(config):
+    lines = []
+    lines.append("=" * 70)
+    lines.append(f"LED MARKER CALCULATOR - Lamp {config.ARDUINO_ID}")
+    lines.append("=" * 70)
+    lines.append("")
+    lines.append("CONFIGURATION:")
+    lines.append(f"  Wave Height Strip: LED {config.WAVE_HEIGHT_BOTTOM} → {config.WAVE_HEIGHT_TOP} ({config.WAVE_HEIGHT_LENGTH} LEDs)")
+    lines.append(f"  Wind Speed Strip:  LED {config.WIND_SPEED_BOTTOM} → {config.WIND_SPEED_TOP} ({config.WIND_SPEED_LENGTH} LEDs)")
+    lines.append(f"  Wave Period Strip: LED {config.WAVE_PERIOD_BOTTOM} → {config.WAVE_PERIOD_TOP} ({config.WAVE_PERIOD_LENGTH} LEDs)")
+    lines.append("")
+    lines.append(f"  Max Wave Height: {config.MAX_WAVE_HEIGHT_METERS} meters")
+    lines.append(f"  Max Wind Speed:  {config.MAX_WIND_SPEED_MPS} m/s (~{config.MAX_WIND_SPEED_MPS / KNOTS_TO_MPS:.1f} knots)")
+    lines.append("")
+    lines.append("=" * 70)
+    lines.append("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def print_wave_height_markers(config, wave_markers):
     """Print wave height LED positions for 1m, 2m, 3m."""
-    print("WAVE HEIGHT MARKERS (Right Strip)")
-    print("-" * 70)
-    print()
-
-    for height_m in [1.0, 2.0, 3.0]:
-        num_leds, lit_leds = calculate_wave_height_leds(height_m, config)
+    lines = []
+    lines.append("WAVE HEIGHT MARKERS (Right Strip)")
+    lines.append("-" * 70)
+    lines.append("")
 
+    for height_m, (num_leds, lit_leds) in wave_markers.items():
         if num_leds == 0:
-            print(f"  {height_m}m → No LEDs (below minimum)")
-        elif num_leds >= config['WAVE_HEIGHT_LENGTH']:
-            print(f"  {height_m}m → ALL {num_leds} LEDs (maximum)")
+            lines.append(f"  {height_m}m → No LEDs (below minimum)")
+        elif num_leds >= config.WAVE_HEIGHT_LENGTH:
+            lines.append(f"  {height_m}m → ALL {num_leds} LEDs (maximum)")
         else:
             # Find the topmost lit LED (the marker position)
-            marker_led = lit_leds[-1] if lit_leds else None
-            print(f"  {height_m}m → {num_leds} LEDs lit → Mark at LED #{marker_led}")
+            marker_led = lit_leds[-1]
+            lines.append(f"  {height_m}m → {num_leds} LEDs lit → Mark at LED #{marker_led}")
 
         # Show all lit LED indices for reference
         if lit_leds:
-            print(f"         Lit LEDs: {lit_leds}")
-        print()
-
+            lines.append(f"         Lit LEDs: {lit_leds}")
+        lines.append("")
 
-def print_wind_speed_markers(config):
-    """Print wind speed LED positions for 10, 20, 30 knots."""
-    print("WIND SPEED MARKERS (Center Strip)")
-    print("-" * 70)
-    print()
-    print("NOTE: Wind strip has 2 special LEDs:")
-    print(f"  - LED #{config['WIND_SPEED_BOTTOM']} = Status indicator (always on)")
-    print(f"  - LED #{config['WIND_SPEED_TOP']} = Wind direction (colored by direction)")
-    print()
+    sys.stdout.write("\n".join(lines) + "\n")
 
-    for wind_knots in [10, 20, 30]:
-        num_leds, lit_leds, wind_mps = calculate_wind_speed_leds(wind_knots, config)
 
+def print_wind_speed_markers(config, wind_markers):
+    """Print wind speed LED positions for 10, 20, 30 knots."""
+    lines = []
+    lines.append("WIND SPEED MARKERS (Center Strip)")
+    lines.append("-" * 70)
+    lines.append("")
+    lines.append("NOTE: Wind strip has 2 special LEDs:")
+    lines.append(f"  - LED #{config.WIND_SPEED_BOTTOM} = Status indicator (always on)")
+    lines.append(f"  - LED #{config.WIND_SPEED_TOP} = Wind direction (colored by direction)")
+    lines.append("")
+
+    for wind_knots, (num_leds, lit_leds, wind_mps) in wind_markers.items():
         if num_leds == 0:
-            print(f"  {wind_knots} knots ({wind_mps:.1f} m/s) → No data LEDs (below minimum)")
-        elif num_leds >= (config['WIND_SPEED_LENGTH'] - 2):
-            print(f"  {wind_knots} knots ({wind_mps:.1f} m/s) → ALL {num_leds} data LEDs (maximum)")
+            lines.append(f"  {wind_knots} knots ({wind_mps:.1f} m/s) → No data LEDs (below minimum)")
+        elif num_leds >= (config.WIND_SPEED_LENGTH - 2):
+            lines.append(f"  {wind_knots} knots ({wind_mps:.1f} m/s) → ALL {num_leds} data LEDs (maximum)")
         else:
             # Find the topmost lit LED (the marker position)
-            marker_led = lit_leds[-1] if lit_leds else None
-            print(f"  {wind_knots} knots ({wind_mps:.1f} m/s) → {num_leds} data LEDs lit → Mark at LED #{marker_led}")
+            marker_led = lit_leds[-1]
+            lines.append(f"  {wind_knots} knots ({wind_mps:.1f} m/s) → {num_leds} data LEDs lit → Mark at LED #{marker_led}")
 
         # Show all lit LED indices for reference
         if lit_leds:
-            print(f"         Lit data LEDs: {lit_leds}")
-        print()
+            lines.append(f"         Lit data LEDs: {lit_leds}")
+        lines.append("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def print_summary(config):
+def print_summary(config, wave_markers, wind_markers):
     """Print summary of marker positions."""
-    print("=" * 70)
-    print("PHYSICAL MARKING GUIDE")
-    print("=" * 70)
-    print()
-    print("Use stickers, tape, or permanent marker to label these LED positions:")
-    print()
+    lines = []
+    lines.append("=" * 70)
+    lines.append("PHYSICAL MARKING GUIDE")
+    lines.append("=" * 70)
+    lines.append("")
+    lines.append("Use stickers, tape, or permanent marker to label these LED positions:")
+    lines.append("")
 
     # Wave height markers
-    print("WAVE HEIGHT STRIP:")
-    for height_m in [1.0, 2.0, 3.0]:
-        num_leds, lit_leds = calculate_wave_height_leds(height_m, config)
-        if lit_leds and num_leds < config['WAVE_HEIGHT_LENGTH']:
-            marker_led = lit_leds[-1]
-            print(f"  → Mark LED #{marker_led:2d} = {height_m}m waves")
-    print()
+    lines.append("WAVE HEIGHT STRIP:")
+    wave_limit = config.WAVE_HEIGHT_LENGTH
+    for height_m, (num_leds, lit_leds) in wave_markers.items():
+        # lit_leds is non-empty exactly when num_leds > 0
+        if 0 < num_leds < wave_limit:
+            lines.append(f"  → Mark LED #{lit_leds[-1]:2d} = {height_m}m waves")
+    lines.append("")
 
     # Wind speed markers
-    print("WIND SPEED STRIP:")
-    for wind_knots in [10, 20, 30]:
-        num_leds, lit_leds, _ = calculate_wind_speed_leds(wind_knots, config)
-        if lit_leds and num_leds < (config['WIND_SPEED_LENGTH'] - 2):
-            marker_led = lit_leds[-1]
-            print(f"  → Mark LED #{marker_led:2d} = {wind_knots} knots")
-    print()
-    print("=" * 70)
+    lines.append("WIND SPEED STRIP:")
+    wind_limit = config.WIND_SPEED_LENGTH - 2  # Excludes status and direction LEDs
+    for wind_knots, (num_leds, lit_leds, _) in wind_markers.items():
+        if 0 < num_leds < wind_limit:
+            lines.append(f"  → Mark LED #{lit_leds[-1]:2d} = {wind_knots} knots")
+    lines.append("")
+    lines.append("=" * 70)
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -237,11 +291,17 @@ def main():
     # Parse configuration
     config = parse_config_h(config_path)
 
+    # Calculate each marker once; the detail and summary sections share them
+    wave_markers = {height_m: calculate_wave_height_leds(height_m, config)
+                    for height_m in WAVE_MARKER_HEIGHTS_M}
+    wind_markers = {wind_knots: calculate_wind_speed_leds(wind_knots, config)
+                    for wind_knots in WIND_MARKER_KNOTS}
+
     # Print results
     print_header(config)
-    print_wave_height_markers(config)
-    print_wind_speed_markers(config)
-    print_summary(config)
+    print_wave_height_markers(config, wave_markers)
+    print_wind_speed_markers(config, wind_markers)
+    print_summary(config, wave_markers, wind_markers)
 
     print()
     print("✅ Calculation complete!")
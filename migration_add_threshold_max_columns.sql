@@ -3,10 +3,9 @@
 -- Enables range-based alerts (e.g., alert when waves 1m-3m)
 -- ============================================================
 
+-- Single ALTER so the lock is taken and the catalog updated once for both columns
 ALTER TABLE users
-ADD COLUMN wave_threshold_max_m DOUBLE PRECISION DEFAULT NULL;
-
-ALTER TABLE users
+ADD COLUMN wave_threshold_max_m DOUBLE PRECISION DEFAULT NULL,
 ADD COLUMN wind_threshold_max_knots DOUBLE PRECISION DEFAULT NULL;
 
 -- Verification
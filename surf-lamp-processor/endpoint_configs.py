@@ -17,6 +17,8 @@ Without this parameter:
 - Arduino receives wrong wind speeds and displays incorrect alerts
 """
 
+from functools import lru_cache
+
 # In surf-lamp-processor/endpoint_configs.py
 
 FIELD_MAPPINGS = {
@@ -63,6 +65,12 @@ FIELD_MAPPINGS = {
     },
 }
 
+# Isramar parameter name fragment -> standardized field, checked in order
+ISRAMAR_PARAMETERS = (
+    ("Significant wave height", "wave_height_m"),
+    ("Peak wave period", "wave_period_s"),
+)
+
 def extract_isramar_data(raw_data):
     """
     CORRECTED: Custom extraction function for Isramar.
@@ -80,19 +88,23 @@ def extract_isramar_data(raw_data):
         if not values:
             continue
 
-        if "Significant wave height" in name:
-            extracted["wave_height_m"] = float(values[0])
-        elif "Peak wave period" in name:
-            extracted["wave_period_s"] = float(values[0])
+        for name_fragment, field in ISRAMAR_PARAMETERS:
+            if name_fragment in name:
+                extracted[field] = float(values[0])
+                break
 
     return extracted
 
 # The rest of the file (get_endpoint_config, etc.) remains the same
 
+@lru_cache(maxsize=256)
 def get_endpoint_config(endpoint_url):
     """
     Get the field mapping configuration for a given endpoint URL.
-    
+
+    Results are cached per URL: each location polls the same endpoints
+    every cycle, so the substring scan only runs once per URL.
+
     Args:
         endpoint_url (str): The API endpoint URL
         
@@ -15,10 +15,13 @@ import json
 import time
 import logging
 from datetime import datetime
-from endpoint_configs import get_endpoint_config
+from endpoint_configs import get_endpoint_config, extract_isramar_data
 
 logger = logging.getLogger(__name__)
 
+# Config entries that describe how to extract, rather than a field to extract
+CONFIG_META_KEYS = frozenset({'fallbacks', 'conversions', 'custom_extraction'})
+
 
 def extract_field_value(data, field_path):
     """
@@ -118,7 +121,6 @@ def standardize_surf_data(raw_data, endpoint_url):
     standardized = {}
 
     if config.get('custom_extraction'):
-        from endpoint_configs import extract_isramar_data
         standardized = extract_isramar_data(raw_data)
     else:
         conversions = config.get('conversions', {})
@@ -131,7 +133,7 @@ def standardize_surf_data(raw_data, endpoint_url):
                 current_hour_index = get_current_hour_index(time_array)
 
         for standard_field, field_path in config.items():
-            if standard_field in ['fallbacks', 'conversions', 'custom_extraction']:
+            if standard_field in CONFIG_META_KEYS:
                 continue
 
             # For Open-Meteo hourly data, replace hardcoded index with current hour index
@@ -19,6 +19,10 @@ from surf_data_transformer import standardize_surf_data
 
 logger = logging.getLogger(__name__)
 
+# Shared session so repeated calls to the same API hosts reuse keep-alive
+# connections instead of paying a new TCP + TLS handshake every cycle
+http_session = requests.Session()
+
 
 def fetch_surf_data(api_key, endpoint):
     """Fetch surf data from external API and standardize using config
@@ -64,13 +68,19 @@ def fetch_surf_data(api_key, endpoint):
         timeout_seconds = 30 if "openweathermap.org" in endpoint else 15
         logger.info(f"📤 Using {timeout_seconds}s timeout for this API")
 
+        # Fail fast on unreachable hosts; only the read gets the full budget
+        connect_timeout = 5
+
         for attempt in range(max_retries):
             try:
-                response = requests.get(endpoint, headers=headers, timeout=timeout_seconds)
+                response = http_session.get(endpoint, headers=headers, timeout=(connect_timeout, timeout_seconds))
                 response.raise_for_status()
                 break  # Success, exit retry loop
-            except requests.exceptions.Timeout:
-                logger.warning(f"⚠️ Request timeout ({timeout_seconds}s) for {endpoint}")
+            except requests.exceptions.Timeout as e:
+                if isinstance(e, requests.exceptions.ConnectTimeout):
+                    logger.warning(f"⚠️ Connect timeout ({connect_timeout}s) for {endpoint}")
+                else:
+                    logger.warning(f"⚠️ Read timeout ({timeout_seconds}s) for {endpoint}")
                 if attempt < max_retries - 1:  # Not the last attempt
                     delay = 30  # Shorter delay for timeout retries
                     logger.warning(f"⚠️ Retrying in {delay} seconds... (attempt {attempt + 1}/{max_retries})")
@@ -96,10 +106,14 @@ def fetch_surf_data(api_key, endpoint):
         time.sleep(30)
 
         logger.info(f"✅ API call successful: {response.status_code}")
-        logger.debug(f"📥 Raw response: {response.text[:200]}...")
+        # Decode straight from the body bytes; response.text would run charset
+        # detection over the whole payload just to build a debug preview
+        raw_body = response.content
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"📥 Raw response: {raw_body[:200].decode('utf-8', 'replace')}...")
 
         # Parse JSON response
-        raw_data = response.json()
+        raw_data = json.loads(raw_body)
 
         # Standardize using endpoint configuration
         surf_data = standardize_surf_data(raw_data, endpoint)
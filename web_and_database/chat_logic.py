@@ -2,19 +2,10 @@ import logging
 from datetime import datetime
 import pytz
 from data_base import LOCATION_TIMEZONES
+from utils.helpers import convert_wind_direction
 
 logger = logging.getLogger(__name__)
 
-def convert_wind_direction(degrees):
-    """Convert wind direction from degrees to compass direction"""
-    if degrees is None:
-        return "--"
-    
-    directions = ["N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
-                 "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"]
-    index = round(degrees / 22.5) % 16
-    return directions[index]
-
 def is_quiet_hours(user_location, quiet_start_hour=22, quiet_end_hour=6):
     """
     Check if current time in user's location is within quiet hours.
@@ -5,6 +5,10 @@ from data_base import LOCATION_TIMEZONES
 
 logger = logging.getLogger(__name__)
 
+# 16-point compass rose, one entry per 22.5 degrees starting at North
+COMPASS_DIRECTIONS = ("N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
+                      "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW")
+
 def get_current_tz_offset(user_location):
     """
     Get current UTC offset in hours for user's location.
@@ -100,8 +104,5 @@ def convert_wind_direction(degrees):
     """Convert wind direction from degrees to compass direction"""
     if degrees is None:
         return "--"
-    
-    directions = ["N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
-                 "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"]
-    index = round(degrees / 22.5) % 16
-    return directions[index]
+
+    return COMPASS_DIRECTIONS[round(degrees / 22.5) % 16]